@@ -8,7 +8,12 @@ except ImportError:
     __version__ = "unknown"
 
 
-from ._reader import napari_get_reader, read_surface, reader_function
+from ._reader import (
+    clear_cache,
+    napari_get_reader,
+    read_surface,
+    reader_function,
+)
 from ._sample_data import stanford_bunny
 from ._widget import DynamicComboBox, SurfaceChannelChange
 from ._writer import write_multiple, write_single_surface
@@ -17,6 +22,7 @@ __all__ = (
     "napari_get_reader",
     "reader_function",
     "read_surface",
+    "clear_cache",
     "write_single_surface",
     "write_multiple",
     "SurfaceChannelChange",
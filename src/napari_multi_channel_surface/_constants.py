@@ -14,3 +14,26 @@ _FILE_EXTENSIONS = [
     ".dat",
     ".tec",
 ]
+
+#: Set of ``_FILE_EXTENSIONS`` for fast membership checks
+_FILE_EXTENSIONS_SET = frozenset(_FILE_EXTENSIONS)
+
+#: Extensions that meshio can read from an in-memory buffer, with their meshio file format
+_BUFFERED_FILE_FORMATS = {
+    ".ply": "ply",
+    ".h5m": "h5m",
+    ".hmf": "hmf",
+    ".med": "med",
+}
+
+#: Files larger than this (in bytes) are never read into memory before parsing
+_BUFFERED_READ_MAX_SIZE = 2 * 1024**3
+
+#: Maximum number of threads used to read multiple surfaces
+_MAX_READ_WORKERS = 8
+
+#: Environment variable that disables reading multiple surfaces in parallel when set to "0"
+_PARALLEL_READ_ENV = "NAPARI_MCS_PARALLEL_READ"
+
+#: Maximum total size (in bytes) of the arrays of parsed meshes kept by the reader
+_READ_CACHE_MAX_BYTES = 256 * 1024**2
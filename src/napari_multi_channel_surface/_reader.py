@@ -2,14 +2,32 @@
 This module contains reader functions to load surfaces and color data into napari.
 """
 
+import io
+import os
+import stat
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import meshio
 import numpy as np
 from pandas import DataFrame
 
-from ._constants import _FILE_EXTENSIONS
+from ._constants import (
+    _BUFFERED_FILE_FORMATS,
+    _BUFFERED_READ_MAX_SIZE,
+    _FILE_EXTENSIONS_SET,
+    _MAX_READ_WORKERS,
+    _PARALLEL_READ_ENV,
+    _READ_CACHE_MAX_BYTES,
+)
+
+#: dtype used to store double precision channels read by ``read_surface``.
+#: Set to ``None`` to keep the precision stored in the file.
+CHANNEL_DTYPE: type[np.floating] | None = np.float32
 
 
 def napari_get_reader(path: str | Path | list[str | Path]) -> Callable | None:
@@ -42,26 +60,27 @@ def napari_get_reader(path: str | Path | list[str | Path]) -> Callable | None:
     # if isinstance(path, list):
     #     # Check all paths to ensure that at least one is readable
     #     for p in path:
-    #         if Path(p).suffix in _FILE_EXTENSIONS:
+    #         if Path(p).suffix in _FILE_EXTENSIONS_SET:
     #             valid_path_found = True
     #             break
     # else:
-    #     valid_path_found = Path(path).suffix in _FILE_EXTENSIONS
+    #     valid_path_found = Path(path).suffix in _FILE_EXTENSIONS_SET
     # return reader_function if valid_path_found else None
     if isinstance(path, list):
         # reader plugins may be handed single path, or a list of paths.
         # we assume that if one path is readable, then all are readable.
         path = path[0]
-    path = Path(path)
+    # meshio matches extensions case-insensitively
+    suffix = os.path.splitext(path)[1].lower()
     # if we know we cannot read the file, we immediately return None.
-    if path.suffix not in _FILE_EXTENSIONS:
+    if suffix not in _FILE_EXTENSIONS_SET:
         return None
 
     # otherwise we return the *function* that can read ``path``.
     return reader_function
 
 
-def reader_function(path):
+def reader_function(path, buffered: bool = True):
     """Take a path or list of paths and return a list of
     ``LayerData`` ``tuple`` s representing surfaces read from the input path(s).
 
@@ -69,6 +88,9 @@ def reader_function(path):
     ----------
     path : str or Path or list of str or list of Path
         Path to file, or list of paths.
+    buffered : bool, optional
+        If ``True`` (default), read each file into memory before parsing where the
+        file format allows it. See ``read_surface``.
 
     Returns
     -------
@@ -79,15 +101,27 @@ def reader_function(path):
     See Also
     --------
     read_surface : function called to read each input surface.
+
+    Notes
+    -----
+    Multiple surfaces are read in parallel threads. This can be disabled by setting
+    the environment variable ``NAPARI_MCS_PARALLEL_READ=0``.
     """
     # handle both a string and a list of strings
     paths = path if isinstance(path, list) else [path]
-    # Read all data
-    layer_data = [read_surface(p) for p in paths]
+    read = partial(read_surface, buffered=buffered)
+    if len(paths) == 1 or os.environ.get(_PARALLEL_READ_ENV, "1") == "0":
+        # Read all data
+        return [read(p) for p in paths]
+    # Threads rather than processes, to avoid pickling large arrays
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_READ_WORKERS, len(paths))
+    ) as executor:
+        layer_data = list(executor.map(read, paths))
     return layer_data
 
 
-def read_surface(path):
+def read_surface(path, buffered: bool = True):
     """Read surface data and return as a ``LayerData`` ``tuple``
 
     A ``LayerData`` ``tuple``
@@ -107,6 +141,10 @@ def read_surface(path):
     ----------
     path : str or Path
         Path to file.
+    buffered : bool, optional
+        If ``True`` (default), files in formats that ``meshio`` can parse from memory
+        are read from disk in a single call before parsing, which is much faster
+        on network file systems. Files larger than 2 GB are always parsed from disk.
 
     Returns
     -------
@@ -121,44 +159,270 @@ def read_surface(path):
 
     See Also
     --------
-    napari.layers.Surface
+    napari.layers.Surface, clear_cache
+
+    Notes
+    -----
+    Recently read files are cached, and are only parsed again if their modification
+    time or size changes. To avoid copies, the vertices, faces, and point data
+    channels of a cached file are shared with the cache and are read-only: copy
+    them before modifying them in place. Files too large for the cache are
+    returned as writable arrays.
+
+    Double precision (``float64``) channels are stored as ``CHANNEL_DTYPE``
+    (``numpy.float32`` by default) to halve their memory use, provided that all
+    their finite values fit in ``CHANNEL_DTYPE``. Integer and other channels keep
+    their dtype. Channels are converted once, before being cached. With the
+    default setting, a ``float64`` file that is opened and then saved is written
+    with ``float32`` channels.
+    Set ``napari_multi_channel_surface._reader.CHANNEL_DTYPE = None`` to keep the
+    precision stored in the file.
     """
+    path = Path(path)
+    # A single stat call, reused for the cache key and the buffered read
     try:
-        mesh = meshio.read(path)
+        file_stat = path.stat()
+    except OSError:
+        file_stat = None
+    try:
+        if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+            # CHANNEL_DTYPE is part of the key, as it changes the cached channels
+            key = (
+                str(path),
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+                CHANNEL_DTYPE,
+            )
+            surface = _read_cache.get(key)
+            if surface is None:
+                surface = _read_surface_arrays(
+                    path, buffered, file_stat.st_size
+                )
+                _read_cache.put(key, surface)
+        else:
+            surface = _read_surface_arrays(path, buffered)
     except SystemExit as exc:
         raise RuntimeError(
             "Surface file is not in a readable format."
         ) from exc
-
-    points = mesh.points
-    cells = np.array([])
-    for cell in mesh.cells:
-        if cell.type == "triangle":
-            cells = cell.data
-            break
+    points, cells, point_data = surface
     data = (points, cells)
 
     # kwargs used by viewer.add_surface() during layer creation
     meta_kwargs = {}
-    n_points = points.shape[0]
-    if len(mesh.point_data) > 0:
+    if point_data is not None:
         # store point_data as the metadata item ``'point_data'```
-        point_data = {}
-        for k in mesh.point_data:
-            if mesh.point_data[k].size == n_points:
-                # Force to be 1D to fit DataFrame specification
-                point_data[k] = mesh.point_data[k].flatten()
-            elif (
-                mesh.point_data[k].shape[0] == n_points
-                and len(mesh.point_data[k].shape) == 2
-            ):
-                # 2D array, split into channels
-                n_channels = mesh.point_data[k].shape[1]
-                # TODO: make more robust by checking that no other channels have the given set of names
-                for i in range(n_channels):
-                    point_data[f"{k}_C{i}"] = mesh.point_data[k][:, i]
-
-        meta_kwargs["metadata"] = {"point_data": DataFrame(point_data)}
+        # Each channel keeps its own dtype; copy=False avoids copying the arrays
+        meta_kwargs["metadata"] = {
+            "point_data": DataFrame(point_data, copy=False)
+        }
 
     layer_type = "surface"
     return (data, meta_kwargs, layer_type)
+
+
+def _read_surface_arrays(
+    path, buffered: bool = True, size: int | None = None
+) -> tuple:
+    """Read the vertices, faces, and point data channels of a surface file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to file.
+    buffered, size : optional
+        Passed to ``_read_mesh``.
+
+    Returns
+    -------
+    points : numpy.ndarray
+        Vertex coordinates.
+    cells : numpy.ndarray
+        Vertex indices of the triangular faces.
+    point_data : dict of str to numpy.ndarray or None
+        1D channels, with double precision channels stored as ``CHANNEL_DTYPE``
+        (see ``read_surface``), or ``None`` if the file has no point data.
+    """
+    mesh = _read_mesh(path, buffered, size=size)
+    points = mesh.points
+    # mesh.cells_dict is not used: it is rebuilt on every access and
+    # concatenates (copies) the blocks of every cell type.
+    triangle_blocks = [c.data for c in mesh.cells if c.type == "triangle"]
+    if len(triangle_blocks) == 1:
+        cells = triangle_blocks[0]
+    elif len(triangle_blocks) > 1:
+        cells = np.concatenate(triangle_blocks, axis=0)
+    else:
+        # No faces: use a correctly shaped and typed empty array
+        cells = np.empty((0, 3), dtype=np.int32)
+
+    if len(mesh.point_data) == 0:
+        return points, cells, None
+    n_points = points.shape[0]
+    point_data = {}
+    for k, values in mesh.point_data.items():
+        if values.size == n_points:
+            # Force to be 1D to fit DataFrame specification (view when possible)
+            point_data[k] = values.ravel()
+        elif values.ndim == 2 and values.shape[0] == n_points:
+            # 2D array, split into channels
+            n_channels = values.shape[1]
+            # TODO: make more robust by checking that no other channels have the given set of names
+            for i in range(n_channels):
+                point_data[f"{k}_C{i}"] = values[:, i]
+
+    if CHANNEL_DTYPE is not None:
+        # Double precision is not needed to color vertices
+        for k, v in point_data.items():
+            if _fits_channel_dtype(v):
+                point_data[k] = v.astype(CHANNEL_DTYPE)
+    return points, cells, point_data
+
+
+def _fits_channel_dtype(values: np.ndarray) -> bool:
+    """Check if a channel should be downcast to ``CHANNEL_DTYPE``.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values of a single channel.
+
+    Returns
+    -------
+    bool
+        ``True`` if ``values`` is ``float64`` and its finite values are within
+        the range of ``CHANNEL_DTYPE``.
+    """
+    if values.dtype != np.float64:
+        return False
+    max_abs = np.max(np.abs(values), where=np.isfinite(values), initial=0.0)
+    return bool(max_abs <= np.finfo(CHANNEL_DTYPE).max)
+
+
+class _SurfaceCache:
+    """Least recently used cache of parsed surfaces, bounded by the size of their arrays.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size (in bytes) of the cached arrays. Surfaces larger than this
+        are not cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._surfaces: OrderedDict[tuple, tuple] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self._nbytes = 0
+        # reader_function may read files in several threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size (in bytes) of the cached arrays."""
+        return self._nbytes
+
+    def get(self, key: tuple) -> tuple | None:
+        """Return the surface stored under ``key``, or ``None`` if not cached."""
+        with self._lock:
+            surface = self._surfaces.get(key)
+            if surface is not None:
+                self._surfaces.move_to_end(key)
+            return surface
+
+    def put(self, key: tuple, surface: tuple) -> bool:
+        """Store ``surface`` under ``key``, evicting the least recently used surfaces.
+
+        The arrays of a stored surface are made read-only, since they are shared by
+        every caller of ``get``.
+
+        Returns
+        -------
+        bool
+            ``True`` if ``surface`` was stored, ``False`` if it is too large.
+        """
+        size = sum(a.nbytes for a in _surface_arrays(surface))
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._surfaces:
+                return True
+            for a in _surface_arrays(surface):
+                a.setflags(write=False)
+            self._surfaces[key] = surface
+            self._sizes[key] = size
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                old_key, _ = self._surfaces.popitem(last=False)
+                self._nbytes -= self._sizes.pop(old_key)
+        return True
+
+    def clear(self) -> None:
+        """Remove all surfaces from the cache."""
+        with self._lock:
+            self._surfaces.clear()
+            self._sizes.clear()
+            self._nbytes = 0
+
+
+#: Surfaces read by ``read_surface``, keyed by
+#: ``(path, mtime_ns, size, CHANNEL_DTYPE)``
+_read_cache = _SurfaceCache(_READ_CACHE_MAX_BYTES)
+
+
+def clear_cache():
+    """Clear the cache of surface files read by ``read_surface``.
+
+    See Also
+    --------
+    read_surface
+    """
+    _read_cache.clear()
+
+
+def _surface_arrays(surface: tuple) -> list[np.ndarray]:
+    """Arrays of a surface returned by ``_read_surface_arrays``."""
+    points, cells, point_data = surface
+    channels = [] if point_data is None else list(point_data.values())
+    return [points, cells] + channels
+
+
+def _read_mesh(
+    path,
+    buffered: bool = True,
+    max_size: int = _BUFFERED_READ_MAX_SIZE,
+    size: int | None = None,
+) -> meshio.Mesh:
+    """Read a mesh with ``meshio``, reading the whole file into memory first if possible.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to file.
+    buffered : bool, optional
+        If ``False``, always let ``meshio`` read from disk.
+    max_size : int, optional
+        Largest file size (in bytes) that is read into memory.
+    size : int, optional
+        Size of the file (in bytes), if already known. Passing it avoids looking up
+        the file metadata again, which is slow on network file systems.
+
+    Returns
+    -------
+    meshio.Mesh
+        The mesh read from ``path``.
+    """
+    path = Path(path)
+    file_format = _BUFFERED_FILE_FORMATS.get(path.suffix.lower())
+    if not buffered or file_format is None:
+        return meshio.read(path)
+    if size is None:
+        if not path.is_file():
+            return meshio.read(path)
+        size = path.stat().st_size
+    if size >= max_size:
+        return meshio.read(path)
+    return meshio.read(io.BytesIO(path.read_bytes()), file_format=file_format)
@@ -6,6 +6,8 @@ References:
 - Widget specification: https://napari.org/stable/plugins/building_a_plugin/guides.html#widgets
 """
 
+import weakref
+from itertools import islice
 from typing import TYPE_CHECKING
 
 import magicgui.widgets as widgets
@@ -30,9 +32,27 @@ class SurfaceChannelChange(widgets.Container):
         The Viewer object to which the widget is attached.
     """
 
+    # Base classes still provide ``__dict__``; slots give faster access to
+    # the attributes used by the callbacks.
+    __slots__ = (
+        "_viewer",
+        "_channel_cache",
+        "_surface_layers",
+        "_surface_layer_combo",
+        "_channel_selector",
+    )
+
     def __init__(self, viewer: "napari.viewer.Viewer") -> None:
         super().__init__()
         self._viewer = viewer
+        # Channel names for each surface layer, stored as
+        # ``(channels, n_points, point_data, columns)``. Entries are dropped
+        # with the layer.
+        self._channel_cache: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+        # Surface layers in ``_viewer``, in layer order
+        self._surface_layers: list = []
         # Dropdown menu of surface layer list
         self._surface_layer_combo = DynamicComboBox(
             label="Surface", annotation="napari.layers.Surface"
@@ -42,7 +62,13 @@ class SurfaceChannelChange(widgets.Container):
 
         ## assign callbacks
         # Update surface list on any change in the viewer layers
-        self._viewer.layers.events.connect(self._on_layers_changed)
+        layer_events = self._viewer.layers.events
+        layer_events.inserted.connect(self._on_layer_inserted)
+        layer_events.removed.connect(self._on_layer_removed)
+        layer_events.changed.connect(self._on_layers_changed)
+        # ``reordered`` also follows every ``moved`` event: connecting both
+        # would rescan the layer list twice per move
+        layer_events.reordered.connect(self._on_layers_changed)
         # update channel list when surface changes
         self._surface_layer_combo.changed.connect(self._on_change_surface)
         # update surface representation when channel changes
@@ -65,45 +91,69 @@ class SurfaceChannelChange(widgets.Container):
         # )
 
     def _on_layers_changed(self, event):
-        """Callback for the event of the layers in ``_viewer`` changing.
+        """Callback for the event of the layers in ``_viewer`` being moved or replaced.
 
         Parameters
         ----------
-        event : napari.events.Event
-            change event triggered by adding, removing, or replacing a layer in ``_viewer``.
+        event : napari.events.Event or None
+            change event triggered by moving, reordering, or replacing a layer in ``_viewer``.
 
         Notes
         -----
         Implementation finds all ``napari.layers.Surface`` layer object in ``_viewer.layers``
-        from scratch each time a change event is triggered.
-        Since these events involve loading/unloading data, it is unlikely
-        that the inefficiency of this approach will be noticeable. Alternatives would require handling
-        each event type separately, and could become more dependent on the LayerList representation.
+        from scratch. This is only needed when layers are moved or replaced;
+        insertions and removals are handled incrementally by ``_on_layer_inserted``
+        and ``_on_layer_removed``.
         """
-        layer_events = [
-            "inserted",
-            "removed",
-            "moved",
-            "changed",
-            "reordered",
+        from napari.layers import Surface
+
+        self._surface_layers = [
+            x for x in self._viewer.layers if isinstance(x, Surface)
         ]
-        # if event is None:
-        #     notifications.show_debug("Creating surface layer list")
-        # elif str(event.type) in layer_events:
-        #     notifications.show_debug(
-        #         f"Updating surface layer list in response to {event.type}"
-        #     )
-        # else:
-        if event is not None and str(event.type) not in layer_events:
-            #     notifications.show_debug(
-            #         f"Ignoring surface layer event {event.type}"
-            #     )
+        self._update_surface_choices()
+
+    def _on_layer_inserted(self, event):
+        """Callback for the event of a layer being inserted in ``_viewer``.
+
+        Parameters
+        ----------
+        event : napari.events.Event
+            insertion event, with the new layer at ``event.value``
+            and its position in ``_viewer.layers`` at ``event.index``.
+        """
+        from napari.layers import Surface
+
+        layer = event.value
+        if not isinstance(layer, Surface):
             return
-        surface_list = [
-            x for x in self._viewer.layers if type(x).__name__ == "Surface"
+        # Position among surfaces = number of surfaces before the new layer.
+        # Avoid slicing: a LayerList slice builds and connects a new LayerList.
+        position = sum(
+            isinstance(x, Surface)
+            for x in islice(self._viewer.layers, event.index)
+        )
+        self._surface_layers.insert(position, layer)
+        self._update_surface_choices()
+
+    def _on_layer_removed(self, event):
+        """Callback for the event of a layer being removed from ``_viewer``.
+
+        Parameters
+        ----------
+        event : napari.events.Event
+            removal event, with the removed layer at ``event.value``.
+        """
+        n_surfaces = len(self._surface_layers)
+        self._surface_layers = [
+            x for x in self._surface_layers if x is not event.value
         ]
-        self._surface_layer_combo.choices = surface_list
-        if len(surface_list) == 0:
+        if len(self._surface_layers) != n_surfaces:
+            self._update_surface_choices()
+
+    def _update_surface_choices(self):
+        """Set the choices of ``_surface_layer_combo`` to the current surface layers."""
+        self._surface_layer_combo.choices = self._surface_layers
+        if len(self._surface_layers) == 0:
             # no surfaces present: clear channel widget
             self._on_change_surface(None)
 
@@ -130,16 +180,53 @@ class SurfaceChannelChange(widgets.Container):
             surface_layer is not None
             and "point_data" in surface_layer.metadata
         ):
-            # Surface layer contains point_data.
-            n_points = surface_layer.vertices.shape[0]
-            point_data = surface_layer.metadata["point_data"]
-            if np.shape(point_data)[0] == n_points:
-                # Point data is in the correct format
-                channels = tuple(point_data.columns)
+            channels = self._get_channels(surface_layer)
         self._channel_selector.choices = channels
         if current_channel in channels and current_channel is not None:
             self._channel_selector.value = current_channel
 
+    def _get_channels(self, surface_layer: "napari.layers.Surface") -> tuple:
+        """Get the channel names stored in the point data of ``surface_layer``.
+
+        Results are cached per layer, and recomputed only if
+        ``surface_layer.metadata['point_data']`` is replaced, its columns change
+        (pandas replaces the ``columns`` index when columns are added, removed or
+        renamed), or the number of vertices changes.
+
+        Parameters
+        ----------
+        surface_layer : napari.layers.Surface
+            A ``Surface`` object with ``'point_data'`` in its metadata.
+
+        Returns
+        -------
+        tuple of str
+            The channel names, or an empty ``tuple`` if the point data does not
+            match the vertices of ``surface_layer``.
+        """
+        n_points = surface_layer.vertices.shape[0]
+        point_data = surface_layer.metadata["point_data"]
+        columns = getattr(point_data, "columns", None)
+        cached = self._channel_cache.get(surface_layer)
+        if (
+            cached is not None
+            and cached[1] == n_points
+            and cached[2] is point_data
+            and cached[3] is columns
+        ):
+            return cached[0]
+        channels = ()
+        if np.shape(point_data)[0] == n_points:
+            # Point data is in the correct format
+            channels = tuple(columns)
+        self._channel_cache[surface_layer] = (
+            channels,
+            n_points,
+            point_data,
+            columns,
+        )
+        return channels
+
     def _on_change_channel(self, channel_name):
         """Callback for the event of a new channel being selected in ``_channel_selector``.
 
@@ -157,7 +244,10 @@ class SurfaceChannelChange(widgets.Container):
         point_data = surface_layer.metadata["point_data"]
         # notifications.show_debug(f"{channel_name=}")
         if channel_name in point_data:
-            surface_layer.vertex_values = np.array(point_data[channel_name])
+            # Use a view of the column to avoid copying the channel data
+            surface_layer.vertex_values = point_data[channel_name].to_numpy(
+                copy=False
+            )
         # else:
         #     notifications.show_warning(
         #         f"Point data {channel_name} not found in Surface {surface_layer}. No changes made."
@@ -179,14 +269,39 @@ class DynamicComboBox(widgets.ComboBox):
     napari.
     To counter this, we initialize ``choices`` with a function that returns the ``choices`` property.
     This function is set as the default ``choices`` function, leading ``reset_choices()`` to do nothing.
+    The current choices are cached as a ``tuple`` whenever they are set, so reading
+    ``choices`` does not query the backend widget.
     """
 
     def __init__(self, **kwargs):
         choices = kwargs.pop("choices") if "choices" in kwargs else ()
+        self._choices_cache: tuple = ()
         super().__init__(choices=self._return_choices, **kwargs)
         self.choices = choices
 
+    @property
+    def choices(self) -> tuple:
+        """Available value choices for this widget."""
+        return self._choices_cache
+
+    @choices.setter
+    def choices(self, choices) -> None:
+        widgets.ComboBox.choices.fset(self, choices)
+        self._update_choices_cache()
+
+    def set_choice(self, choice_name: str, data=None) -> None:
+        super().set_choice(choice_name, data)
+        self._update_choices_cache()
+
+    def del_choice(self, choice_name: str) -> None:
+        super().del_choice(choice_name)
+        self._update_choices_cache()
+
+    def _update_choices_cache(self) -> None:
+        # Store the choices as normalized by the backend widget
+        self._choices_cache = widgets.ComboBox.choices.fget(self)
+
     def _return_choices(
         self, widget: widgets.bases.CategoricalWidget
     ) -> tuple:
-        return self.choices
+        return self._choices_cache
@@ -7,8 +7,10 @@ see: https://napari.org/stable/plugins/building_a_plugin/guides.html#writers
 
 from __future__ import annotations
 
+import os
 import re
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Union
 
@@ -20,6 +22,9 @@ if TYPE_CHECKING:
     DataType = Union[Any, Sequence[Any]]
     FullLayerData = tuple[DataType, dict, str]
 
+#: Matches the number at the end of a file stem, e.g. ``'12'`` in ``'mesh12'``
+_NUMBERED_STEM_RE = re.compile(r"(\d+)$")
+
 
 def write_single_surface(path: str | Path, data: Any, meta: dict) -> list[str]:
     """Write a single ``Surface`` layer.
@@ -44,7 +49,12 @@ def write_single_surface(path: str | Path, data: Any, meta: dict) -> list[str]:
     --------
     write_multiple, napari.layers.Surface
     """
-    cells = [("triangle", np.array(data[1]))]
+    # Only copy faces that are not already a contiguous int32/int64 array
+    faces = np.asarray(data[1])
+    if faces.dtype not in (np.int32, np.int64):
+        faces = faces.astype(np.int32)
+    faces = np.ascontiguousarray(faces)
+    cells = [("triangle", faces)]
     mesh = meshio.Mesh(data[0], cells=cells)
     if "metadata" in meta and "point_data" in meta["metadata"]:
         point_data = meta["metadata"]["point_data"]
@@ -52,8 +62,11 @@ def write_single_surface(path: str | Path, data: Any, meta: dict) -> list[str]:
             isinstance(point_data, DataFrame)
             and point_data.shape[0] == data[0].shape[0]
         ):
+            # Pass views of the point data to meshio rather than copies:
+            # each column is contiguous whether pandas holds the channels
+            # in one block or in one block per column
             for k in point_data.columns:
-                mesh.point_data[k] = np.array(point_data[k])
+                mesh.point_data[str(k)] = point_data[k].to_numpy(copy=False)
     mesh.write(path)
 
     # return path to any file(s) that were successfully written
@@ -92,47 +105,68 @@ def write_multiple(path: str, data: list[FullLayerData]) -> list[str]:
         # Not allowing multi-surface files at this point.
         return []
 
-    output_files = []
+    # Identify relevant layers
+    surface_layers = [
+        (layer_data, meta)
+        for layer_data, meta, layer_type in data
+        if layer_type == "surface"
+    ]
+    if len(surface_layers) == 0:
+        # Nothing to write
+        return []
+
+    output_files: set[Path] = set()
+    # Next number to try for each (name base, suffix) when resolving name clashes
+    next_numbers: dict[tuple[str, str], int] = {}
     output_args = []
-    # Identify relevant layers and assign output paths
-    for layer in data:
-        layer_data, meta, layer_type = layer
-        if layer_type == "surface":
-            # Correct data type, can write
-            name = meta.get("name", "mesh0.vtu")
-            mesh_file = out_dir.joinpath(name)
-            if mesh_file.suffix == "":
-                # Apply an appropriate suffix
-                mesh_file = out_dir.joinpath(f"{mesh_file.stem}.vtu")
-            if mesh_file in output_files:
-                # Avoid overwriting current dataset
-                number_match = re.match(r".*[\D](\d+)", mesh_file.stem)
-                if number_match is None:
-                    # Previous file has no number suffix, start counting at 0
-                    mesh_file = out_dir.joinpath(
-                        f"{mesh_file.name}0{mesh_file.suffix}"
-                    )
-                else:
-                    # Number suffix found, start counting at the next integer
-                    current_str = number_match.group(1)
-                    name_base = mesh_file.stem[: -len(current_str)]
-                    next_number = int(current_str) + 1
-                    mesh_file = out_dir.joinpath(
-                        f"{name_base}{next_number}{mesh_file.suffix}"
-                    )
-                    while mesh_file in output_files:
-                        next_number += 1
-                        mesh_file = out_dir.joinpath(
-                            f"{name_base}{next_number}{mesh_file.suffix}"
-                        )
-            output_files.append(mesh_file)
-            output_args.append((mesh_file, layer_data, meta))
+    # Assign output paths
+    for layer_data, meta in surface_layers:
+        name = meta.get("name", "mesh0.vtu")
+        mesh_file = out_dir.joinpath(name)
+        if mesh_file.suffix == "":
+            # Apply an appropriate suffix
+            mesh_file = out_dir.joinpath(f"{mesh_file.stem}.vtu")
+        if mesh_file in output_files:
+            # Avoid overwriting current dataset
+            number_match = _NUMBERED_STEM_RE.search(mesh_file.stem)
+            if number_match is None:
+                # Previous file has no number suffix, start counting at 0
+                name_base = mesh_file.stem
+                next_number = 0
+            else:
+                # Number suffix found, start counting at the next integer
+                current_str = number_match.group(1)
+                name_base = mesh_file.stem[: -len(current_str)]
+                next_number = int(current_str) + 1
+            key = (name_base, mesh_file.suffix)
+            next_number = max(next_number, next_numbers.get(key, 0))
+            mesh_file = out_dir.joinpath(
+                f"{name_base}{next_number}{mesh_file.suffix}"
+            )
+            while mesh_file in output_files:
+                next_number += 1
+                mesh_file = out_dir.joinpath(
+                    f"{name_base}{next_number}{mesh_file.suffix}"
+                )
+            next_numbers[key] = next_number + 1
+        output_files.add(mesh_file)
+        output_args.append((mesh_file, layer_data, meta))
 
     output_paths = []
     out_dir.mkdir(exist_ok=True)
     # write output files
-    for mesh_file, layer_data, meta in output_args:
-        mesh_path = write_single_surface(mesh_file, layer_data, meta)
-        output_paths.extend(mesh_path)
+    if len(output_args) <= 1:
+        for mesh_file, layer_data, meta in output_args:
+            mesh_path = write_single_surface(mesh_file, layer_data, meta)
+            output_paths.extend(mesh_path)
+    else:
+        # Threads rather than processes: layer data and metadata need not be picklable
+        with ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(output_args))
+        ) as executor:
+            for mesh_path in executor.map(
+                lambda args: write_single_surface(*args), output_args
+            ):
+                output_paths.extend(mesh_path)
     # return path to any file(s) that were successfully written
     return output_paths
@@ -6,15 +6,47 @@ import pytest
 
 cell_type_dim = {"line": 2, "triangle": 3, "quad": 4}
 
+# Vertices of ``simple_mesh``; read-only as the array is shared by all meshes
+simple_mesh_points = np.asarray(
+    [[0, 0, 0], [0, 20, 20], [10, 0, 0], [10, 10, 10]], dtype=np.float32
+)
+simple_mesh_points.setflags(write=False)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def simple_mesh(request):
-    """A simple mesh fixture to test reading and writing."""
-    points = [[0, 0, 0], [0, 20, 20], [10, 0, 0], [10, 10, 10]]
+    """A simple mesh fixture to test reading and writing.
+
+    The mesh is shared by all tests in a module: copy it before modifying.
+    """
     cell_types = getattr(request, "param", ["triangle"])
 
-    cells: list[tuple[str, list[np.ndarray]]] = []
+    cells: list[tuple[str, np.ndarray]] = []
     for s in cell_types:
         d = cell_type_dim[s]
-        cells += [(s, [np.arange(d) + i for i in range(5 - d)])]
-    return meshio.Mesh(points, cells)
+        # Cell i has vertices i, i+1, ..., i+d-1
+        cells.append((s, np.arange(d)[None, :] + np.arange(5 - d)[:, None]))
+    return meshio.Mesh(simple_mesh_points, cells)
+
+
+@pytest.fixture(scope="session")
+def _mesh_file_cache(tmp_path_factory):
+    """Directory and ``dict`` of mesh files written by ``simple_mesh_file``."""
+    return tmp_path_factory.mktemp("meshes"), {}
+
+
+@pytest.fixture
+def simple_mesh_file(simple_mesh, suffix, _mesh_file_cache):
+    """Path to ``simple_mesh`` saved in the format given by ``suffix``.
+
+    Each combination of cell types and ``suffix`` is only written once per session,
+    so the file must not be modified.
+    """
+    mesh_dir, mesh_files = _mesh_file_cache
+    cell_types = tuple(cell.type for cell in simple_mesh.cells)
+    key = (cell_types, suffix)
+    if key not in mesh_files:
+        mesh_file = mesh_dir.joinpath("-".join(cell_types) + suffix)
+        simple_mesh.write(mesh_file)
+        mesh_files[key] = mesh_file
+    return mesh_files[key]
@@ -1,6 +1,6 @@
 """Test fixtures in conftest.py"""
 
-from pathlib import Path
+import io
 
 import meshio
 import numpy as np
@@ -12,23 +12,19 @@ import pytest
     [["triangle"], ["triangle", "line"], ["line", "triangle", "quad"]],
     indirect=True,
 )
-def test_simple_mesh_write_read(tmp_path: Path, simple_mesh: meshio.Mesh):
+def test_simple_mesh_write_read(simple_mesh: meshio.Mesh):
     """Confirm that the `simple_mesh` fixture can be written and read correctly with `meshio`."""
-    # Save test mesh data
-    mesh_file = tmp_path.joinpath("test-mesh.ply")
-    simple_mesh.write(mesh_file)
+    # Save test mesh data in memory
+    buffer = io.BytesIO()
+    simple_mesh.write(buffer, file_format="ply")
 
     # Read mesh data
-    mesh_in = meshio.read(mesh_file)
+    buffer.seek(0)
+    mesh_in = meshio.read(buffer, file_format="ply")
 
     np.testing.assert_allclose(simple_mesh.points, mesh_in.points)
     assert len(simple_mesh.cells) == len(mesh_in.cells)
+    cells_in = {cell_in.type: cell_in.data for cell_in in mesh_in.cells}
     for cell in simple_mesh.cells:
-        cell_type = cell.type
-        cell_found = False
-        for cell_in in mesh_in.cells:
-            if cell_in.type == cell_type:
-                assert np.all(cell.data == cell_in.data)
-                cell_found = True
-                break
-        assert cell_found
+        assert cell.type in cells_in
+        np.testing.assert_array_equal(cell.data, cells_in[cell.type])
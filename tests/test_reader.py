@@ -1,15 +1,26 @@
-import os
 from pathlib import Path
 
 import meshio
 import numpy as np
 import pytest
-import pyvista as pv
 from pandas import DataFrame
 
 from napari_multi_channel_surface import napari_get_reader
 from napari_multi_channel_surface._constants import _FILE_EXTENSIONS
-from napari_multi_channel_surface._reader import read_surface
+from napari_multi_channel_surface._reader import (
+    _read_cache,
+    clear_cache,
+    read_surface,
+    reader_function,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_read_cache():
+    """Parse every file with meshio, rather than using earlier reads."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 @pytest.mark.parametrize(
@@ -18,7 +29,9 @@ from napari_multi_channel_surface._reader import read_surface
     + [(["line", "triangle"], ".vtu")],
     indirect=["simple_mesh"],
 )
-def test_surface_reader(tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str):
+def test_surface_reader(
+    simple_mesh: meshio.Mesh, simple_mesh_file: Path, suffix: str
+):
     """Test the `surface_reader` function, which reads a single surface file.
 
     The output is of the form `(data, metadata, layer_type)`, where
@@ -28,17 +41,13 @@ def test_surface_reader(tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str):
     """
 
     # Get cells relevant to napari
-    triangles = []
-    for cell in simple_mesh.cells:
-        if cell.type == "triangle":
-            triangles = cell.data
-
-    # Save test mesh data
-    mesh_file = os.path.join(tmp_path, "test-mesh" + suffix)
-    simple_mesh.write(mesh_file)
+    triangles = next(
+        (c.data for c in simple_mesh.cells if c.type == "triangle"),
+        np.empty((0, 3), dtype=int),
+    )
 
     # Read mesh data
-    layer_data = read_surface(mesh_file)
+    layer_data = read_surface(simple_mesh_file)
 
     # test layer data format
     assert len(layer_data) == 3
@@ -60,16 +69,16 @@ def test_surface_reader_point_data(
     tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str, n_channels: int
 ):
     """Test how reader function handles files with point data."""
+    mesh = simple_mesh.copy()
     # add some point data to the mix
+    base = np.arange(mesh.points.shape[0], dtype=np.int32)
     for n in range(n_channels):
-        simple_mesh.point_data[f"data{n}"] = (
-            np.arange(simple_mesh.points.shape[0]) + n
-        )
-    data_names = list(simple_mesh.point_data.keys())
+        mesh.point_data[f"data{n}"] = base + n
+    data_names = list(mesh.point_data.keys())
 
     # Save test mesh data
-    mesh_file = os.path.join(tmp_path, "test-mesh" + suffix)
-    simple_mesh.write(mesh_file)
+    mesh_file = tmp_path.joinpath(f"test-mesh{suffix}")
+    mesh.write(mesh_file)
 
     # Read test mesh data
     mesh_data = read_surface(mesh_file)
@@ -87,21 +96,207 @@ def test_surface_reader_point_data(
 
     for name in data_names:
         assert name in point_data
-        np.all(simple_mesh.point_data[name] == point_data[name])
+        np.testing.assert_array_equal(point_data[name], mesh.point_data[name])
+
+
+@pytest.mark.parametrize("suffix", _FILE_EXTENSIONS)
+def test_surface_reader_buffered(
+    tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str
+):
+    """Confirm that reading through an in-memory buffer gives the same surface
+    as reading directly from disk."""
+    mesh = simple_mesh.copy()
+    mesh.point_data["data"] = np.arange(mesh.points.shape[0])
+    mesh_file = tmp_path.joinpath(f"mesh{suffix}")
+    mesh.write(mesh_file)
+
+    data, meta, _ = read_surface(mesh_file, buffered=True)
+    # Parse the file again, rather than reusing the cached surface
+    clear_cache()
+    data_ref, meta_ref, _ = read_surface(mesh_file, buffered=False)
+    np.testing.assert_allclose(data[0], data_ref[0])
+    np.testing.assert_array_equal(data[1], data_ref[1])
+    np.testing.assert_allclose(
+        meta["metadata"]["point_data"], meta_ref["metadata"]["point_data"]
+    )
+
+
+def test_surface_reader_buffered_stat(
+    tmp_path: Path, simple_mesh: meshio.Mesh, monkeypatch: pytest.MonkeyPatch
+):
+    """Confirm that a buffered read looks up the file metadata only once."""
+    mesh_file = tmp_path.joinpath("mesh.ply")
+    simple_mesh.write(mesh_file)
+
+    stat_calls = []
+    path_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self)
+        return path_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    read_surface(mesh_file, buffered=True)
+    assert len(stat_calls) == 1
+
+
+def test_surface_reader_cache(tmp_path: Path, simple_mesh: meshio.Mesh):
+    """Confirm that repeated reads share read-only cached arrays, and that
+    modified files are read again."""
+    mesh = simple_mesh.copy()
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    mesh.write(mesh_file)
+
+    data_first = read_surface(mesh_file)[0]
+    data_second = read_surface(mesh_file)[0]
+    assert len(_read_cache) == 1
+    assert np.shares_memory(data_first[0], data_second[0])
+    with pytest.raises(ValueError, match="read-only"):
+        data_first[0][:] = -1
+    np.testing.assert_allclose(data_second[0], mesh.points)
+
+    # Modify the file: new size means it must be read again
+    mesh.point_data["data"] = np.arange(mesh.points.shape[0])
+    mesh.write(mesh_file)
+    _, meta, _ = read_surface(mesh_file)
+    assert "data" in meta["metadata"]["point_data"]
+    assert len(_read_cache) == 2
+
+    clear_cache()
+    assert len(_read_cache) == 0
+    assert _read_cache.nbytes == 0
+
+
+def test_surface_reader_cache_max_bytes(
+    tmp_path: Path, simple_mesh: meshio.Mesh, monkeypatch: pytest.MonkeyPatch
+):
+    """Confirm that meshes larger than the cache are not cached."""
+    monkeypatch.setattr(_read_cache, "max_bytes", 0)
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    simple_mesh.write(mesh_file)
+
+    data_first = read_surface(mesh_file)[0]
+    data_second = read_surface(mesh_file)[0]
+    assert len(_read_cache) == 0
+    assert not np.shares_memory(data_first[0], data_second[0])
+    # Not shared, so left writable
+    assert data_first[0].flags.writeable and data_first[1].flags.writeable
+
+
+def test_surface_reader_cache_buffered(
+    tmp_path: Path, simple_mesh: meshio.Mesh
+):
+    """Confirm that buffered and unbuffered reads share one cache entry."""
+    mesh_file = tmp_path.joinpath("mesh.ply")
+    simple_mesh.write(mesh_file)
+
+    data_buffered = read_surface(mesh_file, buffered=True)[0]
+    data_unbuffered = read_surface(mesh_file, buffered=False)[0]
+    assert len(_read_cache) == 1
+    assert np.shares_memory(data_buffered[0], data_unbuffered[0])
+
+
+@pytest.mark.parametrize(
+    "channel_dtype,expected", [(np.float32, np.float32), (None, np.float64)]
+)
+def test_surface_reader_channel_dtype(
+    tmp_path: Path,
+    simple_mesh: meshio.Mesh,
+    monkeypatch: pytest.MonkeyPatch,
+    channel_dtype,
+    expected,
+):
+    """Confirm that double precision point data is downcast unless disabled."""
+    mesh = simple_mesh.copy()
+    monkeypatch.setattr(
+        "napari_multi_channel_surface._reader.CHANNEL_DTYPE", channel_dtype
+    )
+    values = np.linspace(0, 1, mesh.points.shape[0])
+    mesh.point_data["data"] = values
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    mesh.write(mesh_file)
+
+    point_data = read_surface(mesh_file)[1]["metadata"]["point_data"]
+    assert point_data["data"].dtype == expected
+    np.testing.assert_allclose(point_data["data"], values, rtol=1e-6)
+
+    # Cache hits reuse the converted channel rather than converting again
+    point_data_again = read_surface(mesh_file)[1]["metadata"]["point_data"]
+    assert np.shares_memory(
+        point_data["data"].to_numpy(copy=False),
+        point_data_again["data"].to_numpy(copy=False),
+    )
+
+
+def test_surface_reader_channel_dtype_changed(
+    tmp_path: Path, simple_mesh: meshio.Mesh, monkeypatch: pytest.MonkeyPatch
+):
+    """Confirm that cached channels are not reused after ``CHANNEL_DTYPE``
+    changes."""
+    mesh = simple_mesh.copy()
+    mesh.point_data["data"] = np.linspace(0, 1, mesh.points.shape[0])
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    mesh.write(mesh_file)
+
+    point_data = read_surface(mesh_file)[1]["metadata"]["point_data"]
+    assert point_data["data"].dtype == np.float32
+    monkeypatch.setattr(
+        "napari_multi_channel_surface._reader.CHANNEL_DTYPE", None
+    )
+    point_data = read_surface(mesh_file)[1]["metadata"]["point_data"]
+    assert point_data["data"].dtype == np.float64
+
+
+def test_surface_reader_point_data_dtypes(
+    tmp_path: Path, simple_mesh: meshio.Mesh
+):
+    """Confirm that only float64 channels with values in the float32 range are
+    downcast, and that integer channels keep their dtype and values."""
+    mesh = simple_mesh.copy()
+    n_points = mesh.points.shape[0]
+    ids = 2**40 + 2 * np.arange(n_points, dtype=np.int64) + 1
+    data_dict = {
+        "id": ids,
+        "int": np.arange(n_points, dtype=np.int32),
+        "single": np.linspace(0, 1, n_points, dtype=np.float32),
+        "double": np.linspace(0, 1, n_points),
+        "large": np.full(n_points, 1e300),
+        "nan": np.concatenate([[np.nan], np.linspace(0, 1, n_points - 1)]),
+    }
+    mesh.point_data = dict(data_dict)
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    mesh.write(mesh_file)
+
+    point_data = read_surface(mesh_file)[1]["metadata"]["point_data"]
+    expected_dtypes = {
+        "id": np.int64,
+        "int": np.int32,
+        "single": np.float32,
+        "double": np.float32,
+        "large": np.float64,
+        "nan": np.float32,
+    }
+    for k, dtype in expected_dtypes.items():
+        assert point_data[k].dtype == dtype
+    np.testing.assert_array_equal(point_data["id"], ids)
+    np.testing.assert_array_equal(point_data["int"], data_dict["int"])
+    np.testing.assert_array_equal(point_data["large"], data_dict["large"])
+    np.testing.assert_allclose(point_data["nan"], data_dict["nan"], rtol=1e-6)
 
 
 def test_surface_reader_point_data_rgb(
     tmp_path: Path, simple_mesh: meshio.Mesh
 ):
     """Test how reader function handles files with RGB point data."""
-    n_points = simple_mesh.points.shape[0]
+    mesh = simple_mesh.copy()
+    n_points = mesh.points.shape[0]
     # Add RGB data to mesh
-    simple_mesh.point_data["RGB"] = np.arange(n_points * 3).reshape([-1, 3])
-    simple_mesh.point_data["dummy"] = np.zeros(n_points)
+    mesh.point_data["RGB"] = np.arange(n_points * 3).reshape([-1, 3])
+    mesh.point_data["dummy"] = np.zeros(n_points)
 
     # Save test mesh data
     mesh_file = tmp_path.joinpath("mesh.vtk")
-    simple_mesh.write(mesh_file)
+    mesh.write(mesh_file)
 
     # Read test mesh data
     mesh_data = read_surface(mesh_file)
@@ -123,14 +318,30 @@ def test_surface_reader_point_data_rgb(
         i_found = False
         for k in rgb_columns:
             if k.endswith(str(i)):
-                assert np.all(
-                    simple_mesh.point_data["RGB"][:, i] == point_data[k]
-                )
+                assert np.all(mesh.point_data["RGB"][:, i] == point_data[k])
                 i_found = True
                 break
         assert i_found
 
 
+@pytest.mark.parametrize(
+    "simple_mesh,n_faces",
+    [(["line"], 0), (["triangle", "triangle"], 4)],
+    indirect=["simple_mesh"],
+)
+def test_surface_reader_triangle_blocks(
+    tmp_path: Path, simple_mesh: meshio.Mesh, n_faces: int
+):
+    """Confirm that all triangle blocks are read as faces, and that meshes without
+    triangles give an empty integer array of faces."""
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    simple_mesh.write(mesh_file)
+
+    faces = read_surface(mesh_file)[0][1]
+    assert faces.shape == (n_faces, 3)
+    assert np.issubdtype(faces.dtype, np.integer)
+
+
 def test_surface_reader_cell_data():
     """Future functionality test: import cell data."""
 
@@ -142,6 +353,9 @@ def test_reader_function_directory(tmp_path: Path):
 # TODO: setup with pyvista
 def test_surface_reader_meshio_error(tmp_path: Path):
     """Confirm that `surface_reader` returns the correct exceptions when meshio fails to read."""
+    # Imported here as pyvista (and VTK) is slow to import
+    import pyvista as pv
+
     bad_file = tmp_path.joinpath("bad_mesh.vtk")
     with pytest.raises(meshio.ReadError):
         read_surface(bad_file)
@@ -153,11 +367,9 @@ def test_surface_reader_meshio_error(tmp_path: Path):
 
 
 @pytest.mark.parametrize("suffix", _FILE_EXTENSIONS)
-def test_reader(tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str):
+def test_reader(simple_mesh: meshio.Mesh, simple_mesh_file: Path, suffix: str):
     """Test the reader function satisfies the plugin specification."""
-    # Save test mesh data
-    mesh_file = tmp_path.joinpath(f"mesh{suffix}")
-    simple_mesh.write(mesh_file)
+    mesh_file = simple_mesh_file
 
     # Confirm that we get a reader function
     reader = napari_get_reader(mesh_file)
@@ -177,6 +389,41 @@ def test_reader(tmp_path: Path, simple_mesh: meshio.Mesh, suffix: str):
     np.testing.assert_allclose(simple_mesh.cells[0].data, saved_cells)
 
 
+@pytest.mark.parametrize("parallel", ["1", "0"])
+def test_reader_function_multiple(
+    tmp_path: Path,
+    simple_mesh: meshio.Mesh,
+    monkeypatch: pytest.MonkeyPatch,
+    parallel: str,
+):
+    """Confirm that multiple surfaces are read in order, with and without parallel reading."""
+    monkeypatch.setenv("NAPARI_MCS_PARALLEL_READ", parallel)
+    mesh_files = []
+    for k in range(3):
+        mesh_file = tmp_path.joinpath(f"mesh{k}.vtu")
+        meshio.Mesh(simple_mesh.points + k, simple_mesh.cells).write(mesh_file)
+        mesh_files.append(mesh_file)
+
+    layer_data_list = reader_function(mesh_files)
+    assert len(layer_data_list) == len(mesh_files)
+    for k, layer_data in enumerate(layer_data_list):
+        np.testing.assert_allclose(layer_data[0][0], simple_mesh.points + k)
+
+
 def test_get_reader_pass():
     reader = napari_get_reader("fake.file")
     assert reader is None
+
+
+@pytest.mark.parametrize(
+    "path", ["mesh.VTU", Path("dir.ply/mesh.Ply"), ["a.vtk", "b.file"]]
+)
+def test_get_reader_suffix(path):
+    """Confirm that suffixes are matched case-insensitively on the file name only."""
+    assert napari_get_reader(path) is not None
+
+
+@pytest.mark.parametrize("path", ["dir.ply/mesh", ".ply", Path("mesh.stl")])
+def test_get_reader_suffix_fail(path):
+    """Confirm that paths without a supported suffix are rejected."""
+    assert napari_get_reader(path) is None
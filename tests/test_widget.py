@@ -20,9 +20,8 @@ def test_surface_channel_change_widget(make_napari_viewer):
     viewer = make_napari_viewer()
     points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
     cells = np.array([[0, 1, 2], [1, 2, 3]])
-    point_data = DataFrame(
-        {f"data{i}": np.arange(len(points)) + i for i in range(2)}
-    )
+    base = np.arange(len(points))
+    point_data = DataFrame({f"data{i}": base + i for i in range(2)})
     layer = viewer.add_surface(
         (points, cells), metadata={"point_data": point_data}
     )
@@ -41,7 +40,9 @@ def test_surface_channel_change_widget(make_napari_viewer):
         print(f"{point_data=}")
         print(f"{layer.vertex_values=}")
         # Confirm that the layer vertex data is updated
-        assert np.all(layer.vertex_values == point_data[channel_name])
+        np.testing.assert_array_equal(
+            layer.vertex_values, point_data[channel_name]
+        )
 
 
 def test_surface_channel_change_widget_multisurface(make_napari_viewer):
@@ -73,6 +74,93 @@ def test_surface_channel_change_widget_multisurface(make_napari_viewer):
         assert list(scc_widget._channel_selector.choices) == layer_names[k]
 
 
+def test_surface_channel_change_widget_layer_events(
+    make_napari_viewer, monkeypatch
+):
+    """Confirm that the surface list follows layers being added, moved, and removed
+    after the widget is created, and is rescanned once per move."""
+    viewer = make_napari_viewer()
+    rescans = []
+    on_layers_changed = SurfaceChannelChange._on_layers_changed
+
+    def counting_on_layers_changed(self, event):
+        rescans.append(event)
+        on_layers_changed(self, event)
+
+    monkeypatch.setattr(
+        SurfaceChannelChange, "_on_layers_changed", counting_on_layers_changed
+    )
+    scc_widget = SurfaceChannelChange(viewer)
+    assert list(scc_widget._surface_layer_combo.choices) == []
+
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    cells = np.array([[0, 1, 2], [1, 2, 3]])
+    surface_a = viewer.add_surface((points, cells), name="a")
+    viewer.add_points(points)
+    surface_b = viewer.add_surface((points, cells), name="b")
+    assert list(scc_widget._surface_layer_combo.choices) == [
+        surface_a,
+        surface_b,
+    ]
+
+    rescans.clear()
+    viewer.layers.move(2, 0)
+    assert scc_widget._surface_layers == [surface_b, surface_a]
+    assert len(rescans) == 1
+
+    viewer.layers.remove(surface_b)
+    assert list(scc_widget._surface_layer_combo.choices) == [surface_a]
+    viewer.layers.remove(surface_a)
+    assert list(scc_widget._surface_layer_combo.choices) == []
+
+
+def test_surface_channel_change_widget_point_data_replaced(
+    make_napari_viewer,
+):
+    """Confirm that cached channel lists are refreshed when the point data of a
+    surface is replaced."""
+    viewer = make_napari_viewer()
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    cells = np.array([[0, 1, 2], [1, 2, 3]])
+    point_data = DataFrame({"a": np.arange(len(points))})
+    layer = viewer.add_surface(
+        (points, cells), metadata={"point_data": point_data}
+    )
+    scc_widget = SurfaceChannelChange(viewer)
+    assert list(scc_widget._channel_selector.choices) == ["a"]
+
+    new_point_data = DataFrame({"b": np.arange(len(points)) + 1.0})
+    layer.metadata["point_data"] = new_point_data
+    scc_widget._on_change_surface(layer)
+    assert list(scc_widget._channel_selector.choices) == ["b"]
+    scc_widget._channel_selector.value = "b"
+    np.testing.assert_array_equal(layer.vertex_values, new_point_data["b"])
+
+
+def test_surface_channel_change_widget_point_data_modified(
+    make_napari_viewer,
+):
+    """Confirm that cached channel lists are refreshed when columns are added
+    to or renamed in the point data of a surface in place."""
+    viewer = make_napari_viewer()
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    cells = np.array([[0, 1, 2], [1, 2, 3]])
+    point_data = DataFrame({"a": np.arange(len(points))})
+    layer = viewer.add_surface(
+        (points, cells), metadata={"point_data": point_data}
+    )
+    scc_widget = SurfaceChannelChange(viewer)
+    assert list(scc_widget._channel_selector.choices) == ["a"]
+
+    point_data["new"] = np.arange(len(points)) + 1.0
+    scc_widget._on_change_surface(layer)
+    assert list(scc_widget._channel_selector.choices) == ["a", "new"]
+
+    point_data.rename(columns={"a": "b"}, inplace=True)
+    scc_widget._on_change_surface(layer)
+    assert sorted(scc_widget._channel_selector.choices) == ["b", "new"]
+
+
 @pytest.mark.parametrize("init_choices", [(), ("a",)])
 def test_dynamic_combo_box(init_choices):
     """Confirm that the DynamicComboBox class behaves like a ComboBox that does not reset."""
@@ -88,3 +176,14 @@ def test_dynamic_combo_box(init_choices):
     combo_box.reset_choices()
     # Test 2: DynamicComboBox choices don't reset
     assert combo_box.choices == choices
+
+
+def test_dynamic_combo_box_set_del_choice():
+    """Confirm that cached choices follow choices being added and removed individually."""
+    combo_box = DynamicComboBox(choices=("a", "b"))
+    combo_box.set_choice("c", "c")
+    assert combo_box.choices == ("a", "b", "c")
+    combo_box.del_choice("a")
+    assert combo_box.choices == ("b", "c")
+    combo_box.reset_choices()
+    assert combo_box.choices == ("b", "c")
@@ -5,7 +5,11 @@ import numpy as np
 import pytest
 from pandas import DataFrame
 
-from napari_multi_channel_surface import write_multiple, write_single_surface
+from napari_multi_channel_surface import (
+    read_surface,
+    write_multiple,
+    write_single_surface,
+)
 from napari_multi_channel_surface._constants import _FILE_EXTENSIONS
 
 
@@ -50,6 +54,79 @@ def test_write_single_channels(tmp_path, simple_mesh, suffix):
     )
 
 
+@pytest.mark.parametrize("faces_type", [list, np.uint16, np.int64])
+def test_write_single_faces_type(tmp_path, simple_mesh, faces_type):
+    """Confirm that faces given as lists or other integer types are written."""
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    faces = simple_mesh.cells[0].data
+    if faces_type is list:
+        faces_in = faces.tolist()
+    else:
+        faces_in = faces.astype(faces_type)
+    write_single_surface(mesh_file, (simple_mesh.points, faces_in), {})
+
+    saved_mesh = meshio.read(mesh_file)
+    np.testing.assert_array_equal(saved_mesh.cells[0].data, faces)
+
+
+def test_write_single_mixed_dtypes(tmp_path, simple_mesh):
+    """Confirm that point data with different dtypes per channel keeps its values."""
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    data = (simple_mesh.points, simple_mesh.cells[0].data)
+    n_points = simple_mesh.points.shape[0]
+    data_dict = {
+        "int": np.arange(n_points, dtype=np.int32),
+        "float": np.linspace(0, 1, n_points),
+    }
+    meta = {"metadata": {"point_data": DataFrame(data_dict)}}
+    write_single_surface(mesh_file, data, meta)
+
+    saved_mesh = meshio.read(mesh_file)
+    for k, v in data_dict.items():
+        np.testing.assert_array_equal(saved_mesh.point_data[k], v)
+        assert saved_mesh.point_data[k].dtype == v.dtype
+
+
+def test_write_single_channel_block(tmp_path, simple_mesh):
+    """Confirm that point data built from a single 2D array, with non-string
+    column names, is written correctly."""
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    data = (simple_mesh.points, simple_mesh.cells[0].data)
+    values = np.arange(simple_mesh.points.shape[0] * 3.0).reshape(-1, 3)
+    meta = {"metadata": {"point_data": DataFrame(values)}}
+    write_single_surface(mesh_file, data, meta)
+
+    saved_mesh = meshio.read(mesh_file)
+    for i in range(3):
+        np.testing.assert_array_equal(
+            saved_mesh.point_data[str(i)], values[:, i]
+        )
+
+
+def test_write_single_no_copy(tmp_path, simple_mesh, monkeypatch):
+    """Confirm that point data read by ``read_surface`` is passed to meshio
+    without being copied."""
+    mesh_file = tmp_path.joinpath("mesh.vtu")
+    n_points = simple_mesh.points.shape[0]
+    mesh = simple_mesh.copy()
+    mesh.point_data["a"] = np.arange(n_points, dtype=np.float32)
+    mesh.point_data["b"] = np.ones(n_points, dtype=np.float32)
+    mesh.write(mesh_file)
+    data, meta, _ = read_surface(mesh_file)
+    point_data = meta["metadata"]["point_data"]
+
+    written = []
+    monkeypatch.setattr(
+        meshio.Mesh, "write", lambda self, path: written.append(self)
+    )
+    write_single_surface(tmp_path.joinpath("out.vtu"), data, meta)
+
+    for k in point_data.columns:
+        assert np.shares_memory(
+            written[0].point_data[k], point_data[k].to_numpy(copy=False)
+        )
+
+
 def test_write_multiple(tmp_path, simple_mesh):
     mesh_dir = tmp_path.joinpath("mesh/")
     layer_data = [
@@ -68,3 +145,37 @@ def test_write_multiple(tmp_path, simple_mesh):
         saved_mesh = meshio.read(p)
         np.testing.assert_allclose(saved_mesh.points, layer[0][0])
         np.testing.assert_array_equal(saved_mesh.cells[0].data, layer[0][1])
+
+
+@pytest.mark.parametrize(
+    "names,expected",
+    [
+        (["mesh"] * 3, ["mesh.vtu", "mesh0.vtu", "mesh1.vtu"]),
+        (["mesh1", "mesh1", "mesh2"], ["mesh1.vtu", "mesh2.vtu", "mesh3.vtu"]),
+        (["mesh2a", "mesh2a"], ["mesh2a.vtu", "mesh2a0.vtu"]),
+        (["12", "12"], ["12.vtu", "13.vtu"]),
+    ],
+)
+def test_write_multiple_duplicate_names(
+    tmp_path, simple_mesh, names, expected
+):
+    """Confirm that layers with clashing names are written to distinct files."""
+    mesh_dir = tmp_path.joinpath("mesh/")
+    data = (simple_mesh.points, simple_mesh.cells[0].data)
+    layer_data = [(data, {"name": name}, "surface") for name in names]
+    output_paths = write_multiple(mesh_dir, layer_data)
+    assert output_paths == [str(mesh_dir.joinpath(f)) for f in expected]
+
+
+def test_write_multiple_skips_other_layers(tmp_path, simple_mesh):
+    """Confirm that only surface layers are written."""
+    mesh_dir = tmp_path.joinpath("mesh/")
+    data = (simple_mesh.points, simple_mesh.cells[0].data)
+    layer_data = [
+        (simple_mesh.points, {"name": "points"}, "points"),
+        (data, {"name": "surface"}, "surface"),
+    ]
+    output_paths = write_multiple(mesh_dir, layer_data)
+    assert output_paths == [str(mesh_dir.joinpath("surface.vtu"))]
+
+    assert write_multiple(mesh_dir, layer_data[:1]) == []